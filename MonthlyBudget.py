@@ -1,10 +1,41 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
 import json
 import re
+import ast
+import operator
+import functools
+import bisect
+
+# Only numbers, basic operators, parentheses, and decimal points are allowed
+_SAFE_RE = re.compile(r'^[\d\+\-\*/\.\(\)\s]+$')
+
+# Operators the expression evaluator will apply
+_ALLOWED = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+@functools.lru_cache(maxsize=256)
+def _compile(expression):
+    """Parse an expression once and return its AST body."""
+    return ast.parse(expression, mode='eval').body
+
+def _eval(node):
+    """Recursively evaluate an arithmetic AST node."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp):
+        return _ALLOWED[type(node.op)](_eval(node.left), _eval(node.right))
+    if isinstance(node, ast.UnaryOp):
+        return _ALLOWED[type(node.op)](_eval(node.operand))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
 
 # Function to safely evaluate math expressions
 def evaluate_math(expression):
@@ -12,26 +43,173 @@ def evaluate_math(expression):
     Safely evaluate a mathematical expression.
     Returns the result as a float, or None if invalid.
     """
+    return _evaluate_math_cached(str(expression).strip())
+
+@functools.lru_cache(maxsize=1024)
+def _evaluate_math_cached(expression):
+    """Pure, memoized core of evaluate_math for an already stripped string."""
     try:
-        # Remove any whitespace
-        expression = str(expression).strip()
-        
         # If it's already a number, return it
         try:
             return float(expression)
         except ValueError:
             pass
         
-        # Allow only numbers, basic operators, parentheses, and decimal points
-        if not re.match(r'^[\d\+\-\*/\.\(\)\s]+$', expression):
+        if not _SAFE_RE.match(expression):
             return None
         
-        # Evaluate the expression safely
-        result = eval(expression, {"__builtins__": {}}, {})
-        return float(result)
-    except:
+        # Walk the parsed expression instead of calling eval()
+        return float(_eval(_compile(expression)))
+    except (SyntaxError, ValueError, ZeroDivisionError, KeyError, RecursionError,
+            OverflowError):
         return None
 
+INCOME_COLUMNS = ('source', 'amount')
+EXPENSE_COLUMNS = ('category', 'name', 'amount')
+_DEFAULT_CATEGORIES = (
+    "Housing", "Transportation", "Food & Dining", "Utilities", 
+    "Healthcare", "Entertainment", "Shopping", "Savings", "Other"
+)
+
+def _empty(columns):
+    """Fresh column-oriented store: one parallel list per column."""
+    return {col: [] for col in columns}
+
+def _columns(data, columns):
+    """Freeze parallel column lists into a hashable tuple of tuples."""
+    return tuple(tuple(data[col]) for col in columns)
+
+def _records(data, columns):
+    """Expand parallel column lists into a list of item dicts."""
+    return [dict(zip(columns, row)) for row in zip(*(data[col] for col in columns))]
+
+# Cached DataFrame builders so unchanged item lists skip pandas work on reruns
+@st.cache_data
+def _as_df(columns_tuple, columns):
+    """Build a DataFrame from a tuple of column tuples."""
+    return pd.DataFrame({col: list(values) for col, values in zip(columns, columns_tuple)})
+
+@st.cache_data
+def _display_df(columns_tuple, columns):
+    """Like _as_df, but with amounts pre-formatted as currency strings."""
+    return pd.DataFrame({
+        col: [f"${a:,.2f}" for a in values] if col == 'amount' else list(values)
+        for col, values in zip(columns, columns_tuple)
+    })
+
+@st.cache_data
+def _expense_by_cat(categories, amounts):
+    """Total expense amounts per category."""
+    amounts = np.asarray(amounts, dtype=np.float64)
+    uniq, inv = np.unique(np.array(categories), return_inverse=True)
+    sums = np.bincount(inv, weights=amounts, minlength=len(uniq))
+    return pd.DataFrame({'category': uniq, 'amount': sums})
+
+def _editor_columns(edited_df, columns):
+    """
+    Convert rows from st.data_editor back into parallel column lists.
+    Rows that are incomplete or have a non-positive amount are left out.
+    """
+    edited_df = edited_df.dropna(subset=list(columns))
+    edited_df = edited_df[edited_df['amount'] > 0]
+    for col in columns:
+        if col != 'amount':
+            edited_df = edited_df[edited_df[col].astype(str).str.strip() != '']
+    return {
+        col: (edited_df[col].astype(float) if col == 'amount' else edited_df[col]).tolist()
+        for col in columns
+    }
+
+def _delete_category(category):
+    """Button callback: remove a category from both category lists."""
+    st.session_state.custom_categories.remove(category)
+    st.session_state.custom_categories_sorted.remove(category)
+
+def _clear_all():
+    """Button callback: remove all income and expense items."""
+    st.session_state.income_data = _empty(INCOME_COLUMNS)
+    st.session_state.expense_data = _empty(EXPENSE_COLUMNS)
+    st.session_state.total_income = 0.0
+    st.session_state.total_expenses = 0.0
+
+# Cached chart builders. They return the Figure objects themselves: st.plotly_chart
+# treats a Figure as already validated, while a dict would be rebuilt and re-validated
+# on every rerun. The cached figures are shared, so callers must not modify them.
+# Plotly is imported inside them so it only loads once there is data to chart.
+@st.cache_resource
+def build_pie(expense_by_category_records):
+    """Pie chart of expenses by category from (category, amount) records."""
+    import plotly.express as px
+    
+    expense_by_category = pd.DataFrame(
+        list(expense_by_category_records), columns=['category', 'amount']
+    )
+    fig_pie = px.pie(
+        expense_by_category,
+        values='amount',
+        names='category',
+        title='Expenses by Category',
+        hole=0.3
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    return fig_pie
+
+@st.cache_resource
+def build_summary_bar(total_income, total_expenses, net_balance):
+    """Bar chart comparing income, expenses, and net balance."""
+    import plotly.graph_objects as go
+    
+    summary_data = pd.DataFrame({
+        'Type': ['Income', 'Expenses', 'Net Balance'],
+        'Amount': [total_income, total_expenses, net_balance],
+        'Color': ['green', 'red', 'blue' if net_balance >= 0 else 'orange']
+    })
+    
+    fig_bar = go.Figure()
+    fig_bar.add_trace(go.Bar(
+        x=summary_data['Type'],
+        y=summary_data['Amount'],
+        marker_color=summary_data['Color'],
+        text=[f'${val:,.2f}' for val in summary_data['Amount']],
+        textposition='auto',
+    ))
+    fig_bar.update_layout(
+        title='Budget Summary',
+        yaxis_title='Amount ($)',
+        showlegend=False
+    )
+    return fig_bar
+
+@st.cache_resource
+def build_detailed_bar(expense_columns):
+    """Horizontal bar chart of every expense, sorted by amount."""
+    import plotly.express as px
+    
+    categories, names, amounts = expense_columns
+    amounts = np.asarray(amounts, dtype=np.float64)
+    
+    # Sort the parallel columns with a float64 argsort instead of DataFrame.sort_values
+    order = np.argsort(amounts, kind='stable')
+    expense_df = pd.DataFrame({
+        'category': [categories[i] for i in order],
+        'name': [names[i] for i in order],
+        'amount': amounts[order]
+    })
+    
+    fig_detailed = px.bar(
+        expense_df,
+        y='name',
+        x='amount',
+        color='category',
+        orientation='h',
+        title='All Expenses (Sorted by Amount)',
+        labels={'amount': 'Amount ($)', 'name': 'Expense'},
+        text='amount'
+    )
+    fig_detailed.update_traces(texttemplate='$%{text:,.2f}', textposition='outside')
+    fig_detailed.update_layout(height=max(400, len(expense_df) * 30))
+    return fig_detailed
+
 # Page configuration
 st.set_page_config(
     page_title="Monthly Budget Tracker",
@@ -40,15 +218,20 @@ st.set_page_config(
 )
 
 # Initialize session state
-if 'income_items' not in st.session_state:
-    st.session_state.income_items = []
-if 'expense_items' not in st.session_state:
-    st.session_state.expense_items = []
+# Items are stored column-wise: {'source': [...], 'amount': [...]} etc.
+if 'income_data' not in st.session_state:
+    st.session_state.income_data = _empty(INCOME_COLUMNS)
+if 'expense_data' not in st.session_state:
+    st.session_state.expense_data = _empty(EXPENSE_COLUMNS)
+if 'total_income' not in st.session_state:
+    st.session_state.total_income = 0.0
+if 'total_expenses' not in st.session_state:
+    st.session_state.total_expenses = 0.0
 if 'custom_categories' not in st.session_state:
-    st.session_state.custom_categories = [
-        "Housing", "Transportation", "Food & Dining", "Utilities", 
-        "Healthcare", "Entertainment", "Shopping", "Savings", "Other"
-    ]
+    st.session_state.custom_categories = list(_DEFAULT_CATEGORIES)
+# Sorted copy for display, updated only when categories are added or removed
+if 'custom_categories_sorted' not in st.session_state:
+    st.session_state.custom_categories_sorted = sorted(st.session_state.custom_categories)
 
 # Title
 st.title("💰 Monthly Budget Tracker")
@@ -62,33 +245,30 @@ with st.sidebar:
     
     with tab1:
         st.subheader("Add Income")
-        income_source = st.text_input("Income Source", key="income_source")
-        income_amount_input = st.text_input(
-            "Amount ($)", 
-            key="income_amount",
-            placeholder="e.g., 1000 or 500+250 or 40*52/12",
-            help="Enter a number or math expression (e.g., 40*52/12 for weekly to monthly)"
-        )
-        
-        # Show calculated amount
-        if income_amount_input:
-            calculated = evaluate_math(income_amount_input)
-            if calculated is not None and calculated > 0:
-                st.caption(f"💰 Calculated: ${calculated:,.2f}")
-            elif calculated is not None and calculated <= 0:
-                st.warning("Amount must be greater than 0")
-            else:
-                st.error("Invalid expression. Use only +, -, *, /, (), and numbers")
+        # Inputs live in a form so typing does not rerun the whole script
+        with st.form("add_income", clear_on_submit=True):
+            income_source = st.text_input("Income Source", key="income_source")
+            income_amount_input = st.text_input(
+                "Amount ($)", 
+                key="income_amount",
+                placeholder="e.g., 1000 or 500+250 or 40*52/12",
+                help="Enter a number or math expression (e.g., 40*52/12 for weekly to monthly)"
+            )
+            submitted = st.form_submit_button("Add Income", use_container_width=True)
         
-        if st.button("Add Income", use_container_width=True):
+        if submitted:
+            # Same rule as the data editor: whitespace-only names are not valid
+            income_source = income_source.strip()
             calculated_amount = evaluate_math(income_amount_input) if income_amount_input else None
             if income_source and calculated_amount and calculated_amount > 0:
-                st.session_state.income_items.append({
-                    'source': income_source,
-                    'amount': calculated_amount
-                })
+                st.session_state.income_data['source'].append(income_source)
+                st.session_state.income_data['amount'].append(calculated_amount)
+                st.session_state.total_income += calculated_amount
                 st.success(f"Added {income_source}: ${calculated_amount:.2f}")
-                st.rerun()
+            elif income_amount_input and calculated_amount is None:
+                st.error("Invalid expression. Use only +, -, *, /, (), and numbers")
+            elif calculated_amount is not None and calculated_amount <= 0:
+                st.warning("Amount must be greater than 0")
             else:
                 st.error("Please enter valid source and amount")
     
@@ -97,50 +277,48 @@ with st.sidebar:
         
         # Category management
         with st.expander("➕ Add New Category"):
-            new_category = st.text_input("New Category Name", key="new_category")
-            if st.button("Add Category", use_container_width=True):
+            with st.form("add_category", clear_on_submit=True):
+                new_category = st.text_input("New Category Name", key="new_category")
+                category_submitted = st.form_submit_button("Add Category", use_container_width=True)
+            if category_submitted:
                 if new_category and new_category not in st.session_state.custom_categories:
                     st.session_state.custom_categories.append(new_category)
+                    bisect.insort(st.session_state.custom_categories_sorted, new_category)
                     st.success(f"Added category: {new_category}")
-                    st.rerun()
                 elif new_category in st.session_state.custom_categories:
                     st.warning("Category already exists!")
                 else:
                     st.error("Please enter a category name")
         
-        expense_category = st.selectbox(
-            "Category",
-            sorted(st.session_state.custom_categories),
-            key="expense_category"
-        )
-        expense_name = st.text_input("Expense Name", key="expense_name")
-        expense_amount_input = st.text_input(
-            "Amount ($)", 
-            key="expense_amount",
-            placeholder="e.g., 50 or 25*4 or 100/2",
-            help="Enter a number or math expression (e.g., 25*4 for weekly to monthly)"
-        )
-        
-        # Show calculated amount
-        if expense_amount_input:
-            calculated = evaluate_math(expense_amount_input)
-            if calculated is not None and calculated > 0:
-                st.caption(f"💰 Calculated: ${calculated:,.2f}")
-            elif calculated is not None and calculated <= 0:
-                st.warning("Amount must be greater than 0")
-            else:
-                st.error("Invalid expression. Use only +, -, *, /, (), and numbers")
+        with st.form("add_expense", clear_on_submit=True):
+            expense_category = st.selectbox(
+                "Category",
+                st.session_state.custom_categories_sorted,
+                key="expense_category"
+            )
+            expense_name = st.text_input("Expense Name", key="expense_name")
+            expense_amount_input = st.text_input(
+                "Amount ($)", 
+                key="expense_amount",
+                placeholder="e.g., 50 or 25*4 or 100/2",
+                help="Enter a number or math expression (e.g., 25*4 for weekly to monthly)"
+            )
+            submitted = st.form_submit_button("Add Expense", use_container_width=True)
         
-        if st.button("Add Expense", use_container_width=True):
+        if submitted:
+            # Same rule as the data editor: whitespace-only names are not valid
+            expense_name = expense_name.strip()
             calculated_amount = evaluate_math(expense_amount_input) if expense_amount_input else None
             if expense_name and calculated_amount and calculated_amount > 0:
-                st.session_state.expense_items.append({
-                    'category': expense_category,
-                    'name': expense_name,
-                    'amount': calculated_amount
-                })
+                st.session_state.expense_data['category'].append(expense_category)
+                st.session_state.expense_data['name'].append(expense_name)
+                st.session_state.expense_data['amount'].append(calculated_amount)
+                st.session_state.total_expenses += calculated_amount
                 st.success(f"Added {expense_name}: ${calculated_amount:.2f}")
-                st.rerun()
+            elif expense_amount_input and calculated_amount is None:
+                st.error("Invalid expression. Use only +, -, *, /, (), and numbers")
+            elif calculated_amount is not None and calculated_amount <= 0:
+                st.warning("Amount must be greater than 0")
             else:
                 st.error("Please enter valid name and amount")
     
@@ -149,38 +327,33 @@ with st.sidebar:
     # Manage categories
     with st.expander("📋 Manage Categories"):
         st.write("**Current Categories:**")
-        for category in sorted(st.session_state.custom_categories):
+        for category in st.session_state.custom_categories_sorted:
             col_cat1, col_cat2 = st.columns([3, 1])
             with col_cat1:
                 st.write(f"• {category}")
             with col_cat2:
                 # Prevent deletion if category is in use
-                category_in_use = any(
-                    item['category'] == category 
-                    for item in st.session_state.expense_items
-                )
-                if st.button("🗑️", key=f"del_cat_{category}", 
-                           disabled=category_in_use,
-                           help="Cannot delete category with existing expenses"):
-                    st.session_state.custom_categories.remove(category)
-                    st.rerun()
+                category_in_use = category in st.session_state.expense_data['category']
+                # Deleting in a callback updates state before this list is drawn
+                st.button("🗑️", key=f"del_cat_{category}", 
+                          disabled=category_in_use,
+                          help="Cannot delete category with existing expenses",
+                          on_click=_delete_category, args=(category,))
     
     st.markdown("---")
     
     # Clear buttons
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("Clear All", use_container_width=True):
-            st.session_state.income_items = []
-            st.session_state.expense_items = []
-            st.rerun()
+        # Clearing in a callback updates state before the sidebar is drawn
+        st.button("Clear All", use_container_width=True, on_click=_clear_all)
     
     with col2:
         # Export button
         if st.button("Export Data", use_container_width=True):
             export_data = {
-                'income': st.session_state.income_items,
-                'expenses': st.session_state.expense_items,
+                'income': _records(st.session_state.income_data, INCOME_COLUMNS),
+                'expenses': _records(st.session_state.expense_data, EXPENSE_COLUMNS),
                 'categories': st.session_state.custom_categories
             }
             st.download_button(
@@ -193,9 +366,9 @@ with st.sidebar:
 # Main content area
 col1, col2, col3 = st.columns(3)
 
-# Calculate totals
-total_income = sum(item['amount'] for item in st.session_state.income_items)
-total_expenses = sum(item['amount'] for item in st.session_state.expense_items)
+# Totals are kept up to date wherever items are added, edited, or removed
+total_income = st.session_state.total_income
+total_expenses = st.session_state.total_expenses
 net_balance = total_income - total_expenses
 
 # Display summary metrics
@@ -217,55 +390,36 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📈 Income Breakdown")
-    if st.session_state.income_items:
-        income_df = pd.DataFrame(st.session_state.income_items)
+    if st.session_state.income_data['amount']:
+        income_df = _as_df(_columns(st.session_state.income_data, INCOME_COLUMNS), INCOME_COLUMNS)
         
-        # Create editable table
+        # Editable table: one widget for all rows instead of one per row
         st.write("**Edit Income Items:**")
-        for idx, item in enumerate(st.session_state.income_items):
-            with st.container():
-                col_edit1, col_edit2, col_edit3 = st.columns([3, 2, 1])
-                
-                with col_edit1:
-                    new_source = st.text_input(
-                        "Source",
-                        value=item['source'],
-                        key=f"edit_income_source_{idx}",
-                        label_visibility="collapsed"
-                    )
-                
-                with col_edit2:
-                    new_amount_input = st.text_input(
-                        "Amount",
-                        value=str(item['amount']),
-                        key=f"edit_income_amount_{idx}",
-                        label_visibility="collapsed",
-                        placeholder="Amount or math"
-                    )
-                
-                with col_edit3:
-                    if st.button("🗑️", key=f"del_income_{idx}", help="Delete", use_container_width=True):
-                        st.session_state.income_items.pop(idx)
-                        st.rerun()
-                
-                # Update item if changed
-                new_amount = evaluate_math(new_amount_input)
-                if new_source != item['source'] or (new_amount and new_amount != item['amount']):
-                    if new_source and new_amount and new_amount > 0:
-                        st.session_state.income_items[idx] = {
-                            'source': new_source,
-                            'amount': new_amount
-                        }
-                
-                # Show calculated amount if it's a math expression
-                if new_amount_input and new_amount_input != str(item['amount']):
-                    if new_amount and new_amount > 0:
-                        st.caption(f"💰 = ${new_amount:,.2f}")
+        edited_income = st.data_editor(
+            income_df,
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key="income_editor",
+            column_config={
+                'source': st.column_config.TextColumn("Source", required=True),
+                'amount': st.column_config.NumberColumn(
+                    "Amount ($)", min_value=0.01, format="$%.2f", required=True
+                ),
+            }
+        )
+        
+        # Save changes once the edited rows are complete and valid
+        income_data = _editor_columns(edited_income, INCOME_COLUMNS)
+        if income_data != st.session_state.income_data:
+            st.session_state.income_data = income_data
+            st.session_state.total_income = float(np.sum(income_data['amount']))
+            st.rerun()
         
         # Summary table (read-only)
         st.write("**Summary:**")
         st.dataframe(
-            income_df.style.format({'amount': '${:,.2f}'}),
+            _display_df(_columns(st.session_state.income_data, INCOME_COLUMNS), INCOME_COLUMNS),
             use_container_width=True,
             hide_index=True
         )
@@ -274,67 +428,41 @@ with col1:
 
 with col2:
     st.subheader("📉 Expense Breakdown")
-    if st.session_state.expense_items:
-        expense_df = pd.DataFrame(st.session_state.expense_items)
+    if st.session_state.expense_data['amount']:
+        expense_df = _as_df(_columns(st.session_state.expense_data, EXPENSE_COLUMNS), EXPENSE_COLUMNS)
         
-        # Create editable table
+        # Editable table: one widget for all rows instead of one per row
         st.write("**Edit Expense Items:**")
-        for idx, item in enumerate(st.session_state.expense_items):
-            with st.container():
-                col_edit1, col_edit2, col_edit3, col_edit4 = st.columns([2, 2, 2, 1])
-                
-                with col_edit1:
-                    new_category = st.selectbox(
-                        "Category",
-                        sorted(st.session_state.custom_categories),
-                        index=sorted(st.session_state.custom_categories).index(item['category']) if item['category'] in st.session_state.custom_categories else 0,
-                        key=f"edit_expense_category_{idx}",
-                        label_visibility="collapsed"
-                    )
-                
-                with col_edit2:
-                    new_name = st.text_input(
-                        "Name",
-                        value=item['name'],
-                        key=f"edit_expense_name_{idx}",
-                        label_visibility="collapsed"
-                    )
-                
-                with col_edit3:
-                    new_amount_input = st.text_input(
-                        "Amount",
-                        value=str(item['amount']),
-                        key=f"edit_expense_amount_{idx}",
-                        label_visibility="collapsed",
-                        placeholder="Amount or math"
-                    )
-                
-                with col_edit4:
-                    if st.button("🗑️", key=f"del_expense_{idx}", help="Delete", use_container_width=True):
-                        st.session_state.expense_items.pop(idx)
-                        st.rerun()
-                
-                # Update item if changed
-                new_amount = evaluate_math(new_amount_input)
-                if (new_category != item['category'] or 
-                    new_name != item['name'] or 
-                    (new_amount and new_amount != item['amount'])):
-                    if new_name and new_amount and new_amount > 0:
-                        st.session_state.expense_items[idx] = {
-                            'category': new_category,
-                            'name': new_name,
-                            'amount': new_amount
-                        }
-                
-                # Show calculated amount if it's a math expression
-                if new_amount_input and new_amount_input != str(item['amount']):
-                    if new_amount and new_amount > 0:
-                        st.caption(f"💰 = ${new_amount:,.2f}")
+        edited_expenses = st.data_editor(
+            expense_df,
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key="expense_editor",
+            column_config={
+                'category': st.column_config.SelectboxColumn(
+                    "Category",
+                    options=st.session_state.custom_categories_sorted,
+                    required=True
+                ),
+                'name': st.column_config.TextColumn("Name", required=True),
+                'amount': st.column_config.NumberColumn(
+                    "Amount ($)", min_value=0.01, format="$%.2f", required=True
+                ),
+            }
+        )
+        
+        # Save changes once the edited rows are complete and valid
+        expense_data = _editor_columns(edited_expenses, EXPENSE_COLUMNS)
+        if expense_data != st.session_state.expense_data:
+            st.session_state.expense_data = expense_data
+            st.session_state.total_expenses = float(np.sum(expense_data['amount']))
+            st.rerun()
         
         # Summary table (read-only)
         st.write("**Summary:**")
         st.dataframe(
-            expense_df.style.format({'amount': '${:,.2f}'}),
+            _display_df(_columns(st.session_state.expense_data, EXPENSE_COLUMNS), EXPENSE_COLUMNS),
             use_container_width=True,
             hide_index=True
         )
@@ -344,67 +472,35 @@ with col2:
 st.markdown("---")
 
 # Visualizations
-if st.session_state.expense_items or st.session_state.income_items:
+if st.session_state.expense_data['amount'] or st.session_state.income_data['amount']:
     st.subheader("📊 Visual Analysis")
     
     viz_col1, viz_col2 = st.columns(2)
     
     with viz_col1:
         # Expense pie chart by category
-        if st.session_state.expense_items:
-            expense_df = pd.DataFrame(st.session_state.expense_items)
-            expense_by_category = expense_df.groupby('category')['amount'].sum().reset_index()
+        if st.session_state.expense_data['amount']:
+            expense_by_category = _expense_by_cat(
+                tuple(st.session_state.expense_data['category']),
+                tuple(st.session_state.expense_data['amount'])
+            )
             
-            fig_pie = px.pie(
-                expense_by_category,
-                values='amount',
-                names='category',
-                title='Expenses by Category',
-                hole=0.3
+            fig_pie = build_pie(
+                tuple(expense_by_category.itertuples(index=False, name=None))
             )
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig_pie, use_container_width=True)
     
     with viz_col2:
         # Income vs Expenses bar chart
-        summary_data = pd.DataFrame({
-            'Type': ['Income', 'Expenses', 'Net Balance'],
-            'Amount': [total_income, total_expenses, net_balance],
-            'Color': ['green', 'red', 'blue' if net_balance >= 0 else 'orange']
-        })
-        
-        fig_bar = go.Figure()
-        fig_bar.add_trace(go.Bar(
-            x=summary_data['Type'],
-            y=summary_data['Amount'],
-            marker_color=summary_data['Color'],
-            text=[f'${val:,.2f}' for val in summary_data['Amount']],
-            textposition='auto',
-        ))
-        fig_bar.update_layout(
-            title='Budget Summary',
-            yaxis_title='Amount ($)',
-            showlegend=False
-        )
+        fig_bar = build_summary_bar(total_income, total_expenses, net_balance)
         st.plotly_chart(fig_bar, use_container_width=True)
     
     # Detailed expense breakdown
-    if st.session_state.expense_items:
+    if st.session_state.expense_data['amount']:
         st.subheader("💳 Detailed Expense Analysis")
-        expense_df = pd.DataFrame(st.session_state.expense_items)
-        
-        fig_detailed = px.bar(
-            expense_df.sort_values('amount', ascending=True),
-            y='name',
-            x='amount',
-            color='category',
-            orientation='h',
-            title='All Expenses (Sorted by Amount)',
-            labels={'amount': 'Amount ($)', 'name': 'Expense'},
-            text='amount'
+        fig_detailed = build_detailed_bar(
+            _columns(st.session_state.expense_data, EXPENSE_COLUMNS)
         )
-        fig_detailed.update_traces(texttemplate='$%{text:,.2f}', textposition='outside')
-        fig_detailed.update_layout(height=max(400, len(expense_df) * 30))
         st.plotly_chart(fig_detailed, use_container_width=True)
 
 # Footer with tips
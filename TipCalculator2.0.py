@@ -4,26 +4,37 @@ Tip Calculator - Streamlit App
 A simple app to calculate tips and split bills among people
 """
 import streamlit as st
+import numpy as np
+
+# Tip percentages shown in the comparison table
+COMPARISON_TIPS = np.array([15.0, 18.0, 20.0, 25.0])
 
 def calculate_tip(bill_amount, tip_percentage, num_people=1):
     """
     Calculate tip and total amount per person
     
+    Every argument may be a scalar or a NumPy array; arrays are broadcast
+    against each other so several scenarios are computed in one pass.
+    
     Args:
         bill_amount: The total bill before tip
         tip_percentage: Tip percentage (e.g., 15, 18, 20)
         num_people: Number of people splitting the bill (default: 1)
     
     Returns:
-        Dictionary with tip amount, total, and per person amounts
+        Dictionary of NumPy arrays with tip amount, total, and per person amounts
     """
-    tip_amount = bill_amount * (tip_percentage / 100)
-    total_amount = bill_amount + tip_amount
+    bill = np.asarray(bill_amount, dtype=np.float64)
+    tip_pct = np.asarray(tip_percentage, dtype=np.float64)
+    num_people = np.asarray(num_people)
+    
+    tip_amount = bill * (tip_pct / 100)
+    total_amount = bill + tip_amount
     amount_per_person = total_amount / num_people
     tip_per_person = tip_amount / num_people
     
     return {
-        'bill': bill_amount,
+        'bill': bill,
         'tip_amount': tip_amount,
         'total': total_amount,
         'num_people': num_people,
@@ -142,6 +153,20 @@ def main():
             if num_people > 1:
                 st.write(f"**Total Per Person:** ${result['per_person']:.2f}")
                 st.write(f"**Tip Per Person:** ${result['tip_per_person']:.2f}")
+        
+        # Compare common tip percentages side by side
+        with st.expander("🔍 Compare Tip Percentages"):
+            comparison = calculate_tip(bill_amount, COMPARISON_TIPS, num_people)
+            st.dataframe(
+                {
+                    'Tip %': [f"{pct:g}%" for pct in COMPARISON_TIPS],
+                    'Tip Amount': [f"${val:.2f}" for val in comparison['tip_amount']],
+                    'Total': [f"${val:.2f}" for val in comparison['total']],
+                    'Per Person': [f"${val:.2f}" for val in comparison['per_person']],
+                },
+                use_container_width=True,
+                hide_index=True
+            )
     else:
         st.info("👆 Enter a bill amount to calculate the tip!")
     